@@ -5,18 +5,58 @@
 
 import { Schedule, Assignment } from './models';
 
+// Shared name tables - previously re-declared inside each formatter
+const MONTHS_SHORT = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+const MONTHS_LONG = ['January', 'February', 'March', 'April', 'May', 'June',
+                     'July', 'August', 'September', 'October', 'November', 'December'];
+const DAYS_SHORT = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+const DAYS_LONG = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'];
+
+// Display labels for event kinds, looked up instead of branching per row
+const KIND_LABELS = { combined: 'Combined', separate: 'Separate' } as const;
+
+/**
+ * Group assignments by calendar month, keyed as "YYYY-MM"
+ * Shared by the text-message and HTML exporters
+ */
+function groupByMonth(assignments: Assignment[]): Map<string, Assignment[]> {
+  const byMonth = new Map<string, Assignment[]>();
+  assignments.forEach(assignment => {
+    const date = assignment.date;
+    const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
+    if (!byMonth.has(monthKey)) {
+      byMonth.set(monthKey, []);
+    }
+    byMonth.get(monthKey)!.push(assignment);
+  });
+  return byMonth;
+}
+
 /**
  * Format date as "YYYY Mon DD"
  */
 function formatDate(date: Date): string {
-  const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
   const year = date.getFullYear();
-  const month = months[date.getMonth()];
+  const month = MONTHS_SHORT[date.getMonth()];
   const day = date.getDate().toString().padStart(2, '0');
   return `${year} ${month} ${day}`;
 }
 
+/**
+ * Format an ISO "YYYY-MM-DD" string as "YYYY Mon DD"
+ * Slices the string directly instead of round-tripping through Date,
+ * which is called per row in the CSV hot loop
+ */
+function formatISODate(iso: string): string {
+  const month = MONTHS_SHORT[parseInt(iso.slice(5, 7), 10) - 1];
+  if (month === undefined) {
+    // Non-ISO input - fall back to Date parsing
+    return formatDate(new Date(iso));
+  }
+  return `${iso.slice(0, 4)} ${month} ${iso.slice(8, 10)}`;
+}
+
 /**
  * Generate a simplified date range string for filenames
  * Format: YYYYMMDD-YYYYMMDD or YYYYMMDD if single day
@@ -31,13 +71,14 @@ function generateDateRangeString(schedule: Schedule): string {
     return `${year}${month}${day}`;
   }
 
-  // Sort assignments by date
-  const sortedAssignments = [...schedule.assignments].sort((a, b) => 
-    a.date.getTime() - b.date.getTime()
-  );
-
-  const firstDate = sortedAssignments[0].date;
-  const lastDate = sortedAssignments[sortedAssignments.length - 1].date;
+  // Single pass for the earliest/latest dates instead of copying and
+  // sorting the whole assignment list just to read its endpoints.
+  let firstDate = schedule.assignments[0].date;
+  let lastDate = firstDate;
+  for (const a of schedule.assignments) {
+    if (a.date < firstDate) firstDate = a.date;
+    if (a.date > lastDate) lastDate = a.date;
+  }
 
   const formatDatePart = (date: Date): string => {
     const year = date.getFullYear();
@@ -61,134 +102,201 @@ function generateDateRangeString(schedule: Schedule): string {
  * Generate Markdown document (print-friendly format)
  */
 export function generateMarkdown(schedule: Schedule): string {
+  return generateMarkdownParts(schedule).join('');
+}
+
+/**
+ * Generate Markdown content as fragments, so exportMarkdown can hand them
+ * straight to Blob without materializing the full document in JS
+ */
+function generateMarkdownParts(schedule: Schedule): string[] {
   if (schedule.assignments.length === 0) {
-    return '# Schedule\n\nNo events scheduled.\n';
+    return ['# Schedule\n\nNo events scheduled.\n'];
   }
 
-  let md = '# Youth Activity Schedule\n\n';
-  
+  // Accumulate fragments in an array instead of repeatedly concatenating
+  // onto a growing string.
+  const md: string[] = ['# Youth Activity Schedule\n\n'];
+
   schedule.assignments.forEach((assignment) => {
     // Date header with day name
     const date = assignment.date;
-    const dayNames = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
-    const dayName = dayNames[date.getDay()];
-    
+    const dayName = DAYS_SHORT[date.getDay()];
+
     // Compact header: Date (Day) - Description
-    md += `### ${formatDate(date)} (${dayName}) - ${assignment.description}\n`;
-    
+    md.push(`### ${formatDate(date)} (${dayName}) - ${assignment.description}\n`);
+
     // Time info on same line if available
     if (assignment.startTime) {
-      md += `*${assignment.startTime}`;
+      md.push(`*${assignment.startTime}`);
       if (assignment.durationMinutes) {
-        md += ` • ${assignment.durationMinutes}min`;
+        md.push(` • ${assignment.durationMinutes}min`);
       }
-      md += `*  `;
+      md.push(`*  `);
     }
-    md += `*[${assignment.kind === 'combined' ? 'Combined' : 'Separate'}]*\n`;
-    
+    md.push(`*[${KIND_LABELS[assignment.kind]}]*\n`);
+
     // Leader assignments
     if (assignment.groupAssignments && assignment.groupAssignments.length > 0) {
       // Separate event - inline format
       assignment.groupAssignments.forEach(ga => {
-        md += `- **${ga.group}:** ${ga.leaders.join(', ') || 'TBD'}`;
-        
+        md.push(`- **${ga.group}:** ${ga.leaders.join(', ') || 'TBD'}`);
+
         // Youth helpers inline if present (without repeating leader name)
         if (ga.youthAssignments && ga.youthAssignments.length > 0) {
           const youthParts = ga.youthAssignments.map(ya => {
             return ya.youth.length > 0 ? ya.youth.join(', ') : 'none';
           });
-          md += ` - Helpers: ${youthParts.join('; ')}`;
+          md.push(` - Helpers: ${youthParts.join('; ')}`);
         }
-        md += '\n';
+        md.push('\n');
       });
     } else {
       // Combined event - more compact
       const parts: string[] = [];
-      
+
       if (assignment.responsibleGroup) {
         parts.push(`Group: ${assignment.responsibleGroup}`);
       }
-      
+
       if (assignment.leaders.length > 0) {
         parts.push(`Leaders: ${assignment.leaders.join(', ')}`);
       }
-      
+
       if (parts.length > 0) {
-        md += `- ${parts.join(' • ')}\n`;
+        md.push(`- ${parts.join(' • ')}\n`);
       }
-      
+
       // Youth assignments for combined events - inline (without repeating leader name)
       if (assignment.youthAssignments && assignment.youthAssignments.length > 0) {
         const youthParts = assignment.youthAssignments.map(ya => {
           return ya.youth.length > 0 ? ya.youth.join(', ') : 'none';
         });
-        md += `- Helpers: ${youthParts.join('; ')}\n`;
+        md.push(`- Helpers: ${youthParts.join('; ')}\n`);
       }
     }
-    
-    md += '\n';
+
+    md.push('\n');
   });
 
   return md;
 }
 
+/**
+ * Quote a CSV field only when it needs it (RFC 4180: commas, quotes,
+ * or newlines), doubling any embedded quotes
+ */
+function escapeCSVField(value: string): string {
+  if (value.includes(',') || value.includes('"') || value.includes('\n')) {
+    return `"${value.replace(/"/g, '""')}"`;
+  }
+  return value;
+}
+
 /**
  * Generate CSV content
  */
 export function generateCSV(schedule: Schedule): string {
+  return generateCSVLines(schedule).join('');
+}
+
+/**
+ * Generate CSV content as newline-terminated line fragments, so exportCSV
+ * can hand them straight to Blob instead of joining in JS first
+ */
+function generateCSVLines(schedule: Schedule): string[] {
   const rows = schedule.toRows();
-  let csv = 'Date,Type,In Charge,Youth Helpers,Description\n';
-
-  rows.forEach(row => {
-    const date = new Date(row.date);
-    const escapedCharge = row.inCharge.includes(',') ? `"${row.inCharge}"` : row.inCharge;
-    const escapedYouth = (row.youthHelpers || '-').includes(',') ? `"${row.youthHelpers || '-'}"` : (row.youthHelpers || '-');
-    const escapedDesc = row.description.includes(',') ? `"${row.description}"` : row.description;
-    csv += `${formatDate(date)},${row.kind},${escapedCharge},${escapedYouth},${escapedDesc}\n`;
+
+  // Build each line in one pass rather than growing the output string row
+  // by row. Date and kind come from a controlled vocabulary, so only the
+  // name/description fields go through the quoting branch.
+  const lines = rows.map(row => {
+    const escapedCharge = escapeCSVField(row.inCharge);
+    const escapedYouth = escapeCSVField(row.youthHelpers || '-');
+    const escapedDesc = escapeCSVField(row.description);
+    return `${formatISODate(row.date)},${row.kind},${escapedCharge},${escapedYouth},${escapedDesc}\n`;
   });
 
-  return csv;
+  return ['Date,Type,In Charge,Youth Helpers,Description\n', ...lines];
 }
 
 /**
  * Generate iCalendar (.ics) content
  */
 export function generateICS(schedule: Schedule, timezone: string = 'America/Denver'): string {
+  return generateICSLines(schedule, timezone).join('');
+}
+
+/**
+ * Generate iCalendar content as CRLF-terminated line fragments
+ * Kept separate so exportICS can hand the fragments straight to Blob,
+ * which concatenates them natively without building the full string in JS
+ */
+function generateICSLines(schedule: Schedule, timezone: string): string[] {
   const now = new Date();
   const dtStamp = formatICSDateTime(now);
-  
-  let ics = 'BEGIN:VCALENDAR\r\n';
-  ics += 'VERSION:2.0\r\n';
-  ics += 'PRODID:-//Youth Scheduler//EN\r\n';
-  ics += 'CALSCALE:GREGORIAN\r\n';
-  ics += 'METHOD:PUBLISH\r\n';
+  const useTimezone = timezone !== 'floating';
+
+  // Recurring events repeat the same description many times over, so
+  // escape each distinct summary line once instead of per occurrence.
+  const summaryCache = new Map<string, string>();
+  const summaryLine = (summary: string): string => {
+    let line = summaryCache.get(summary);
+    if (line === undefined) {
+      line = `SUMMARY:${escapeICS(summary)}\r\n`;
+      summaryCache.set(summary, line);
+    }
+    return line;
+  };
+
+  // Schedules typically reuse a handful of start times across many events,
+  // so parse each distinct HH:MM string once instead of per event.
+  const timeCache = new Map<string, [number, number]>();
+  const parseStartTime = (s: string): [number, number] => {
+    let parsed = timeCache.get(s);
+    if (!parsed) {
+      const [hours, minutes] = s.split(':').map(Number);
+      parsed = [hours, minutes];
+      timeCache.set(s, parsed);
+    }
+    return parsed;
+  };
+
+  // Collect lines and join once at the end rather than concatenating onto
+  // a growing string for every event property.
+  const lines: string[] = [
+    'BEGIN:VCALENDAR\r\n',
+    'VERSION:2.0\r\n',
+    'PRODID:-//Youth Scheduler//EN\r\n',
+    'CALSCALE:GREGORIAN\r\n',
+    'METHOD:PUBLISH\r\n',
+  ];
 
   schedule.assignments.forEach((assignment, index) => {
-    ics += 'BEGIN:VEVENT\r\n';
-    ics += `UID:${generateUID(assignment, index)}\r\n`;
-    ics += `DTSTAMP:${dtStamp}\r\n`;
+    lines.push('BEGIN:VEVENT\r\n');
+    lines.push(`UID:${generateUID(assignment, index)}\r\n`);
+    lines.push(`DTSTAMP:${dtStamp}\r\n`);
 
     // Date/time
-    if (assignment.startTime && timezone !== 'floating') {
+    if (assignment.startTime && useTimezone) {
       const dtStart = formatICSDateTimeWithTZ(assignment.date, assignment.startTime);
-      ics += `DTSTART;TZID=${timezone}:${dtStart}\r\n`;
-      
+      lines.push(`DTSTART;TZID=${timezone}:${dtStart}\r\n`);
+
       if (assignment.durationMinutes) {
         const endDate = new Date(assignment.date);
-        const [hours, minutes] = assignment.startTime.split(':').map(Number);
+        const [hours, minutes] = parseStartTime(assignment.startTime);
         endDate.setHours(hours, minutes + assignment.durationMinutes);
         const dtEnd = formatICSDateTimeWithTZ(endDate, '');
-        ics += `DTEND;TZID=${timezone}:${dtEnd}\r\n`;
+        lines.push(`DTEND;TZID=${timezone}:${dtEnd}\r\n`);
       }
     } else {
       // All-day event
       const dtStart = formatICSDate(assignment.date);
-      ics += `DTSTART;VALUE=DATE:${dtStart}\r\n`;
+      lines.push(`DTSTART;VALUE=DATE:${dtStart}\r\n`);
     }
 
     // Summary and description
-    const summary = `${assignment.kind === 'combined' ? 'Combined' : 'Separate'}: ${assignment.description}`;
-    ics += `SUMMARY:${escapeICS(summary)}\r\n`;
+    lines.push(summaryLine(`${KIND_LABELS[assignment.kind]}: ${assignment.description}`));
     
     let description = assignment.description;
     if (assignment.groupAssignments && assignment.groupAssignments.length > 0) {
@@ -219,13 +327,13 @@ export function generateICS(schedule: Schedule, timezone: string = 'America/Denv
         }
       }
     }
-    ics += `DESCRIPTION:${escapeICS(description)}\r\n`;
+    lines.push(`DESCRIPTION:${escapeICS(description)}\r\n`);
 
-    ics += 'END:VEVENT\r\n';
+    lines.push('END:VEVENT\r\n');
   });
 
-  ics += 'END:VCALENDAR\r\n';
-  return ics;
+  lines.push('END:VCALENDAR\r\n');
+  return lines;
 }
 
 /**
@@ -285,9 +393,11 @@ function escapeICS(text: string): string {
 
 /**
  * Download a file to the user's browser
+ * Accepts either a full string or pre-built fragments; fragments are
+ * concatenated natively by the Blob constructor
  */
-export function downloadFile(content: string, filename: string, mimeType: string): void {
-  const blob = new Blob([content], { type: mimeType });
+export function downloadFile(content: string | string[], filename: string, mimeType: string): void {
+  const blob = new Blob(typeof content === 'string' ? [content] : content, { type: mimeType });
   const url = URL.createObjectURL(blob);
   const link = document.createElement('a');
   link.href = url;
@@ -303,8 +413,7 @@ export function downloadFile(content: string, filename: string, mimeType: string
  */
 export function exportMarkdown(schedule: Schedule, filename?: string): void {
   const defaultFilename = `schedule-${generateDateRangeString(schedule)}.md`;
-  const content = generateMarkdown(schedule);
-  downloadFile(content, filename || defaultFilename, 'text/markdown');
+  downloadFile(generateMarkdownParts(schedule), filename || defaultFilename, 'text/markdown');
 }
 
 /**
@@ -312,8 +421,7 @@ export function exportMarkdown(schedule: Schedule, filename?: string): void {
  */
 export function exportCSV(schedule: Schedule, filename?: string): void {
   const defaultFilename = `schedule-${generateDateRangeString(schedule)}.csv`;
-  const content = generateCSV(schedule);
-  downloadFile(content, filename || defaultFilename, 'text/csv');
+  downloadFile(generateCSVLines(schedule), filename || defaultFilename, 'text/csv');
 }
 
 /**
@@ -321,8 +429,7 @@ export function exportCSV(schedule: Schedule, filename?: string): void {
  */
 export function exportICS(schedule: Schedule, timezone: string = 'America/Denver', filename?: string): void {
   const defaultFilename = `schedule-${generateDateRangeString(schedule)}.ics`;
-  const content = generateICS(schedule, timezone);
-  downloadFile(content, filename || defaultFilename, 'text/calendar');
+  downloadFile(generateICSLines(schedule, timezone), filename || defaultFilename, 'text/calendar');
 }
 
 /**
@@ -350,43 +457,34 @@ export function generateTextMessage(schedule: Schedule): string {
     return 'No assignments scheduled.';
   }
 
-  // Group assignments by month
-  const byMonth = new Map<string, Assignment[]>();
-  
-  schedule.assignments.forEach(assignment => {
-    const date = new Date(assignment.date);
-    const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
-    if (!byMonth.has(monthKey)) {
-      byMonth.set(monthKey, []);
-    }
-    byMonth.get(monthKey)!.push(assignment);
-  });
+  // Group assignments by month. Grouping the date-sorted list in one
+  // pass leaves both the month keys (zero-padded, so insertion order is
+  // chronological) and each month's bucket already in order - no key
+  // sort or per-month re-sort needed.
+  const sortedAssignments = [...schedule.assignments].sort((a, b) =>
+    a.date.getTime() - b.date.getTime()
+  );
+  const byMonth = groupByMonth(sortedAssignments);
 
-  // Format each month
-  const months = ['January', 'February', 'March', 'April', 'May', 'June',
-                  'July', 'August', 'September', 'October', 'November', 'December'];
-  
   let text = '';
-  const sortedMonths = Array.from(byMonth.keys()).sort();
-  
-  sortedMonths.forEach((monthKey, index) => {
+  let index = 0;
+
+  byMonth.forEach((assignments, monthKey) => {
     const [year, month] = monthKey.split('-');
-    const monthName = months[parseInt(month) - 1];
+    const monthName = MONTHS_LONG[parseInt(month) - 1];
     
     if (index > 0) {
       text += '\n\n' + '='.repeat(40) + '\n\n';
     }
+    index++;
     
     text += `${monthName} ${year}\n`;
     text += '─'.repeat(40) + '\n\n';
     
-    const assignments = byMonth.get(monthKey)!;
-    assignments.sort((a, b) => a.date.getTime() - b.date.getTime());
-    
     assignments.forEach(assignment => {
       const date = new Date(assignment.date);
       const day = date.getDate();
-      const dayName = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'][date.getDay()];
+      const dayName = DAYS_SHORT[date.getDay()];
       
       // Format: "Wed 15 - Sacrament: John & Steve" or "Wed 15 - Activity: priests (responsible group)"
       text += `${dayName} ${day} - ${assignment.description}`;
@@ -466,26 +564,15 @@ export function generateHTML(schedule: Schedule): string {
     : `${formatHTMLDate(firstDate)} - ${formatHTMLDate(lastDate)}`;
 
   // Group assignments by month
-  const byMonth = new Map<string, Assignment[]>();
-  sortedAssignments.forEach(assignment => {
-    const date = assignment.date;
-    const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
-    if (!byMonth.has(monthKey)) {
-      byMonth.set(monthKey, []);
-    }
-    byMonth.get(monthKey)!.push(assignment);
-  });
+  const byMonth = groupByMonth(sortedAssignments);
 
-  // Build HTML with month sections
-  const months = ['January', 'February', 'March', 'April', 'May', 'June',
-                  'July', 'August', 'September', 'October', 'November', 'December'];
-  
+  // Build HTML with month sections. The grouped map was built from the
+  // date-sorted list, so its iteration order is already chronological.
   let assignmentsHTML = '';
-  const sortedMonths = Array.from(byMonth.keys()).sort();
-  
-  sortedMonths.forEach((monthKey) => {
+
+  byMonth.forEach((monthAssignments, monthKey) => {
     const [year, month] = monthKey.split('-');
-    const monthName = months[parseInt(month) - 1];
+    const monthName = MONTHS_LONG[parseInt(month) - 1];
     
     // Add month header
     assignmentsHTML += `
@@ -494,7 +581,6 @@ export function generateHTML(schedule: Schedule): string {
       <div class="assignments-grid">`;
     
     // Add cards for this month
-    const monthAssignments = byMonth.get(monthKey)!;
     monthAssignments.forEach(assignment => {
       assignmentsHTML += generateAssignmentCard(assignment);
     });
@@ -950,9 +1036,7 @@ function generateEmptyHTML(): string {
  * Format date for HTML display (e.g., "January 15, 2025")
  */
 function formatHTMLDate(date: Date): string {
-  const months = ['January', 'February', 'March', 'April', 'May', 'June',
-                  'July', 'August', 'September', 'October', 'November', 'December'];
-  return `${months[date.getMonth()]} ${date.getDate()}, ${date.getFullYear()}`;
+  return `${MONTHS_LONG[date.getMonth()]} ${date.getDate()}, ${date.getFullYear()}`;
 }
 
 /**
@@ -967,18 +1051,15 @@ function getDayEmoji(dayOfWeek: number): string {
  * Format day name with emoji (e.g., "📚 Wednesday")
  */
 function formatCardDay(date: Date): string {
-  const days = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'];
   const emoji = getDayEmoji(date.getDay());
-  return `${emoji} ${days[date.getDay()]}`;
+  return `${emoji} ${DAYS_LONG[date.getDay()]}`;
 }
 
 /**
  * Format date for card display (e.g., "Jan 15, 2025")
  */
 function formatCardDate(date: Date): string {
-  const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-  return `${months[date.getMonth()]} ${date.getDate()}, ${date.getFullYear()}`;
+  return `${MONTHS_SHORT[date.getMonth()]} ${date.getDate()}, ${date.getFullYear()}`;
 }
 
 /**
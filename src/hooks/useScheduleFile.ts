@@ -210,26 +210,33 @@ export function useScheduleFile(): UseScheduleFileResult {
 
   const generateSchedule = useCallback((startDate: Date, endDate: Date) => {
     if (!file) return;
-    
-    try {
-      const parsedRules = parseRules(file.config.rules);
-      const schedule = buildSchedule(
-        file.config.leaders,
-        file.config.groups,
-        parsedRules,
-        startDate,
-        endDate,
-        'round-robin',
-        1,
-        undefined,
-        file.config.randomSeed
-      );
-      
-      updateFile(f => updateScheduleData(f, schedule, startDate, endDate));
-      setError(null);
-    } catch (e) {
-      setError(e instanceof Error ? e.message : 'Failed to generate schedule');
-    }
+
+    // Defer the heavy scheduling work one tick so React can paint the
+    // loading state before the synchronous build blocks the main thread.
+    setIsLoading(true);
+    window.setTimeout(() => {
+      try {
+        const parsedRules = parseRules(file.config.rules);
+        const schedule = buildSchedule(
+          file.config.leaders,
+          file.config.groups,
+          parsedRules,
+          startDate,
+          endDate,
+          'round-robin',
+          1,
+          undefined,
+          file.config.randomSeed
+        );
+
+        updateFile(f => updateScheduleData(f, schedule, startDate, endDate));
+        setError(null);
+      } catch (e) {
+        setError(e instanceof Error ? e.message : 'Failed to generate schedule');
+      } finally {
+        setIsLoading(false);
+      }
+    }, 0);
   }, [file, updateFile]);
 
   const regenerateRange = useCallback((startDate: Date, endDate: Date, preserveEdits: boolean = true) => {
@@ -237,16 +244,20 @@ export function useScheduleFile(): UseScheduleFileResult {
     
     try {
       const parsedRules = parseRules(file.config.rules);
-      
+
+      // Format the range endpoints once instead of per filter callback
+      const startStr = startDate.toISOString().split('T')[0];
+      const endStr = endDate.toISOString().split('T')[0];
+
       // Get existing assignments outside the range to preserve
-      const existingBefore = file.schedule.assignments.filter(a => a.date < startDate.toISOString().split('T')[0]);
-      const existingAfter = file.schedule.assignments.filter(a => a.date > endDate.toISOString().split('T')[0]);
+      const existingBefore = file.schedule.assignments.filter(a => a.date < startStr);
+      const existingAfter = file.schedule.assignments.filter(a => a.date > endStr);
       
       // Get edited assignments in range if preserving edits
       const editedInRange = preserveEdits 
         ? file.schedule.assignments.filter(a => 
-            a.date >= startDate.toISOString().split('T')[0] && 
-            a.date <= endDate.toISOString().split('T')[0] &&
+            a.date >= startStr && 
+            a.date <= endStr &&
             a.isManuallyEdited
           )
         : [];
@@ -267,23 +278,26 @@ export function useScheduleFile(): UseScheduleFileResult {
       
       // Get the new assignments and filter out dates that have edited assignments
       const editedDates = new Set(editedInRange.map(a => a.date));
-      const newSerializedAssignments = newSchedule.assignments.map(a => ({
-        id: `${a.date.toISOString().split('T')[0]}-${simpleHash(a.description)}`,
-        date: a.date.toISOString().split('T')[0],
-        kind: a.kind,
-        description: a.description,
-        leaders: a.leaders,
-        responsibleGroup: a.responsibleGroup,
-        startTime: a.startTime,
-        durationMinutes: a.durationMinutes,
-        youthAssignments: a.youthAssignments,
-        groupAssignments: a.groupAssignments?.map(ga => ({
-          group: ga.group,
-          leaders: ga.leaders,
-          youthAssignments: ga.youthAssignments,
-        })),
-        isManuallyEdited: false,
-      } as SerializedAssignment)).filter(a => !editedDates.has(a.date));
+      const newSerializedAssignments = newSchedule.assignments.map(a => {
+        const dateStr = a.date.toISOString().split('T')[0];
+        return {
+          id: `${dateStr}-${simpleHash(a.description)}`,
+          date: dateStr,
+          kind: a.kind,
+          description: a.description,
+          leaders: a.leaders,
+          responsibleGroup: a.responsibleGroup,
+          startTime: a.startTime,
+          durationMinutes: a.durationMinutes,
+          youthAssignments: a.youthAssignments,
+          groupAssignments: a.groupAssignments?.map(ga => ({
+            group: ga.group,
+            leaders: ga.leaders,
+            youthAssignments: ga.youthAssignments,
+          })),
+          isManuallyEdited: false,
+        } as SerializedAssignment;
+      }).filter(a => !editedDates.has(a.date));
       
       // Combine all assignments
       const allAssignments = [
@@ -353,23 +367,27 @@ export function useScheduleFile(): UseScheduleFileResult {
   // ============================================================================
   
   const autoSaveTimerRef = useRef<number | null>(null);
-  
+  const lastAutoSavedRef = useRef<ScheduleFile | null>(null);
+
   // Auto-save whenever file changes (debounced)
   useEffect(() => {
     console.log('[useScheduleFile] Auto-save effect triggered, file:', file?.name, 'isDirty:', isDirty);
-    
+
     // Clear any pending auto-save
     if (autoSaveTimerRef.current) {
       clearTimeout(autoSaveTimerRef.current);
     }
-    
+
     // If we have a file, schedule auto-save
-    // Save both dirty and clean files to ensure session recovery works
-    if (file) {
+    // Save both dirty and clean files to ensure session recovery works.
+    // Updates always produce a new file object, so a matching reference
+    // means this exact state was already saved - skip re-serializing it.
+    if (file && file !== lastAutoSavedRef.current) {
       console.log('[useScheduleFile] Scheduling auto-save in', AUTO_SAVE_DEBOUNCE, 'ms');
       autoSaveTimerRef.current = window.setTimeout(() => {
         console.log('[useScheduleFile] Auto-save timer fired, saving...');
         saveSession(file);
+        lastAutoSavedRef.current = file;
       }, AUTO_SAVE_DEBOUNCE);
     }
     
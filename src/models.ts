@@ -61,78 +61,121 @@ export interface Assignment {
   }>;
 }
 
+/**
+ * Flat display/export row produced by Schedule.toRows.
+ * All fields are always present so every row shares one object shape,
+ * which keeps property access monomorphic in the exporter hot loops.
+ */
+export interface ScheduleRow {
+  date: string;
+  kind: string;
+  inCharge: string;
+  description: string;
+  youthHelpers: string;
+}
+
+// toRows runs repeatedly over the same assignment objects (preview render
+// plus each export), so the joined display strings are cached per
+// assignment. WeakMaps let the entries disappear with the assignments.
+const inChargeCache = new WeakMap<Assignment, string>();
+const youthHelpersCache = new WeakMap<Assignment, string>();
+
+/**
+ * Format the "in charge" display string for an assignment
+ */
+function formatInCharge(a: Assignment): string {
+  let inCharge = inChargeCache.get(a);
+  if (inCharge !== undefined) {
+    return inCharge;
+  }
+
+  if (a.groupAssignments && a.groupAssignments.length > 0) {
+    // Grouped separate assignments
+    inCharge = a.groupAssignments
+      .map(ga => `${ga.group}: ${ga.leaders.join(', ') || 'TBD'}`)
+      .join(' | ');
+  } else if (a.responsibleGroup) {
+    inCharge = `${a.responsibleGroup}${a.leaders.length > 0 ? ` (${a.leaders.join(', ')})` : ''}`;
+  } else {
+    inCharge = a.leaders.join(', ') || 'N/A';
+  }
+
+  inChargeCache.set(a, inCharge);
+  return inCharge;
+}
+
+/**
+ * Format the youth helpers display string for an assignment
+ */
+function formatYouthHelpers(a: Assignment): string {
+  let youthHelpers = youthHelpersCache.get(a);
+  if (youthHelpers !== undefined) {
+    return youthHelpers;
+  }
+
+  if (a.groupAssignments && a.groupAssignments.length > 0) {
+    // Format youth for separate events
+    youthHelpers = a.groupAssignments
+      .filter(ga => ga.youthAssignments && ga.youthAssignments.length > 0)
+      .map(ga => {
+        const youthStrs = ga.youthAssignments!
+          .map(ya => `${ya.leader}: ${ya.youth.join(', ') || 'none'}`)
+          .join('; ');
+        return `${ga.group} - ${youthStrs}`;
+      })
+      .join(' | ');
+  } else if (a.youthAssignments && a.youthAssignments.length > 0) {
+    // Format youth for combined events
+    youthHelpers = a.youthAssignments
+      .map(ya => `${ya.leader}: ${ya.youth.join(', ') || 'none'}`)
+      .join(' | ');
+  } else {
+    youthHelpers = '';
+  }
+
+  youthHelpersCache.set(a, youthHelpers);
+  return youthHelpers;
+}
+
 export class Schedule {
   assignments: Assignment[];
 
+  // toRows result, reused across the preview render and each export.
+  // Invalidated by sort(); treat the returned rows as read-only.
+  private rowsCache: ScheduleRow[] | null = null;
+
   constructor(assignments: Assignment[] = []) {
     this.assignments = assignments;
   }
 
   /**
-   * Convert schedule to table rows for display
+   * Convert schedule to table rows for display.
+   * The row list is cached, so callers must not mutate it.
    */
-  toRows(): Array<{
-    date: string;
-    kind: string;
-    inCharge: string;
-    description: string;
-    youthHelpers: string;
-  }> {
-    return this.assignments.map(a => {
-      let inCharge: string;
-      let youthHelpers: string = '';
-      
-      // Handle grouped separate assignments
-      if (a.groupAssignments && a.groupAssignments.length > 0) {
-        inCharge = a.groupAssignments
-          .map(ga => `${ga.group}: ${ga.leaders.join(', ') || 'TBD'}`)
-          .join(' | ');
-        
-        // Format youth for separate events
-        const youthParts = a.groupAssignments
-          .filter(ga => ga.youthAssignments && ga.youthAssignments.length > 0)
-          .map(ga => {
-            const youthStrs = ga.youthAssignments!
-              .map(ya => `${ya.leader}: ${ya.youth.join(', ') || 'none'}`)
-              .join('; ');
-            return `${ga.group} - ${youthStrs}`;
-          });
-        youthHelpers = youthParts.join(' | ');
-      } else if (a.responsibleGroup) {
-        inCharge = `${a.responsibleGroup}${a.leaders.length > 0 ? ` (${a.leaders.join(', ')})` : ''}`;
-        
-        // Format youth for combined events with responsible group
-        if (a.youthAssignments && a.youthAssignments.length > 0) {
-          youthHelpers = a.youthAssignments
-            .map(ya => `${ya.leader}: ${ya.youth.join(', ') || 'none'}`)
-            .join(' | ');
-        }
-      } else {
-        inCharge = a.leaders.join(', ') || 'N/A';
-        
-        // Format youth for combined events
-        if (a.youthAssignments && a.youthAssignments.length > 0) {
-          youthHelpers = a.youthAssignments
-            .map(ya => `${ya.leader}: ${ya.youth.join(', ') || 'none'}`)
-            .join(' | ');
-        }
-      }
-      
-      return {
-        date: a.date.toISOString().split('T')[0],
-        kind: a.kind,
-        inCharge,
-        description: a.description,
-        youthHelpers,
-      };
-    });
+  toRows(): ScheduleRow[] {
+    if (this.rowsCache) {
+      return this.rowsCache;
+    }
+    this.rowsCache = this.assignments.map(a => ({
+      date: getDateFeatures(a.date).iso,
+      kind: a.kind,
+      inCharge: formatInCharge(a),
+      description: a.description,
+      youthHelpers: formatYouthHelpers(a),
+    }));
+    return this.rowsCache;
   }
 
   /**
    * Sort assignments by date
    */
   sort(): void {
-    this.assignments.sort((a, b) => a.date.getTime() - b.date.getTime());
+    // Read each timestamp once rather than per comparison
+    this.assignments = this.assignments
+      .map(a => ({ ts: a.date.getTime(), assignment: a }))
+      .sort((x, y) => x.ts - y.ts)
+      .map(d => d.assignment);
+    this.rowsCache = null;
   }
 }
 
@@ -145,26 +188,74 @@ export interface RawConfig {
   rules: any[];
 }
 
+const WEEKDAY_TOKENS = ['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'];
+
+interface DateFeatures {
+  iso: string; // YYYY-MM-DD (UTC)
+  weekdayToken: string; // sun..sat
+}
+
+// The scheduler checks every leader against every event date, and toRows
+// formats the same dates again for display. Each Date object flows from
+// event expansion through to the assignment, so its formatted features
+// are computed once and looked up thereafter.
+const dateFeaturesCache = new WeakMap<Date, DateFeatures>();
+
 /**
- * Helper to check if a leader is available on a given date
+ * Get the cached ISO string and weekday token for a date
  */
-export function isLeaderAvailable(leader: Leader, date: Date): boolean {
-  if (leader.availability.length === 0) {
-    return true;
+export function getDateFeatures(date: Date): DateFeatures {
+  let features = dateFeaturesCache.get(date);
+  if (!features) {
+    features = {
+      iso: date.toISOString().split('T')[0],
+      weekdayToken: WEEKDAY_TOKENS[date.getDay()],
+    };
+    dateFeaturesCache.set(date, features);
   }
+  return features;
+}
 
-  const iso = date.toISOString().split('T')[0];
-  if (leader.availability.includes(iso)) {
-    return true;
+interface AvailabilityIndex {
+  alwaysAvailable: boolean;
+  isoSet: Set<string>;
+  weekdaySet: Set<string>;
+}
+
+// Availability entries are scanned O(events x leaders) times during
+// generation, so partition each leader's list into sets once. Leaders are
+// plain objects parsed from config, so the index is attached via WeakMap.
+const availabilityIndexCache = new WeakMap<Leader, AvailabilityIndex>();
+
+function getAvailabilityIndex(leader: Leader): AvailabilityIndex {
+  let index = availabilityIndexCache.get(leader);
+  if (!index) {
+    const isoSet = new Set<string>();
+    const weekdaySet = new Set<string>();
+    for (const entry of leader.availability) {
+      if (WEEKDAY_TOKENS.includes(entry)) {
+        weekdaySet.add(entry);
+      } else {
+        isoSet.add(entry);
+      }
+    }
+    index = { alwaysAvailable: leader.availability.length === 0, isoSet, weekdaySet };
+    availabilityIndexCache.set(leader, index);
   }
+  return index;
+}
 
-  const weekdays = ['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'];
-  const weekdayToken = weekdays[date.getDay()];
-  if (leader.availability.includes(weekdayToken)) {
+/**
+ * Helper to check if a leader is available on a given date
+ */
+export function isLeaderAvailable(leader: Leader, date: Date): boolean {
+  const index = getAvailabilityIndex(leader);
+  if (index.alwaysAvailable) {
     return true;
   }
 
-  return false;
+  const { iso, weekdayToken } = getDateFeatures(date);
+  return index.isoSet.has(iso) || index.weekdaySet.has(weekdayToken);
 }
 
 // ============================================================================
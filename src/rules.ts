@@ -67,6 +67,12 @@ export function parseRules(rawRules: any[]): RecurringRule[] {
   });
 }
 
+// Generated dates depend only on the recurrence fields and the year, so
+// results are memoized as timestamps keyed on those. Repeated builds
+// (regeneration, previews) with equivalent rules share entries; fresh
+// Date objects are materialized per call so callers own what they get.
+const generatedDatesCache = new Map<string, number[]>();
+
 /**
  * Generate dates for a recurring rule within a year
  */
@@ -76,22 +82,34 @@ export function generateDates(
   start?: Date,
   end?: Date
 ): Date[] {
-  const dates: Date[] = [];
+  const key = `${rule.frequency}|${rule.weekday}|${rule.nth}|${rule.monthDay}|${rule.month}|${year}`;
+  let timestamps = generatedDatesCache.get(key);
+
+  if (!timestamps) {
+    const dates: Date[] = [];
+
+    if (rule.frequency === 'yearly') {
+      dates.push(...generateYearlyDates(rule, year));
+    } else if (rule.frequency === 'monthly') {
+      dates.push(...generateMonthlyDates(rule, year));
+    } else if (rule.frequency === 'weekly') {
+      dates.push(...generateWeeklyDates(rule, year));
+    }
 
-  if (rule.frequency === 'yearly') {
-    dates.push(...generateYearlyDates(rule, year));
-  } else if (rule.frequency === 'monthly') {
-    dates.push(...generateMonthlyDates(rule, year));
-  } else if (rule.frequency === 'weekly') {
-    dates.push(...generateWeeklyDates(rule, year));
+    timestamps = dates.map(d => d.getTime());
+    generatedDatesCache.set(key, timestamps);
   }
 
   // Filter by start/end range
-  return dates.filter(d => {
-    if (start && d < start) return false;
-    if (end && d > end) return false;
-    return true;
-  });
+  const startTime = start?.getTime();
+  const endTime = end?.getTime();
+  const result: Date[] = [];
+  for (const ts of timestamps) {
+    if (startTime !== undefined && ts < startTime) continue;
+    if (endTime !== undefined && ts > endTime) continue;
+    result.push(new Date(ts));
+  }
+  return result;
 }
 
 function generateYearlyDates(rule: RecurringRule, year: number): Date[] {
@@ -135,15 +153,13 @@ function generateWeeklyDates(rule: RecurringRule, year: number): Date[] {
   if (rule.weekday === undefined) return [];
 
   const dates: Date[] = [];
-  const start = new Date(year, 0, 1);
   const end = new Date(year, 11, 31);
 
-  const current = new Date(start);
-  
-  // Find first occurrence of the weekday
-  while (current.getDay() !== convertWeekday(rule.weekday)) {
-    current.setDate(current.getDate() + 1);
-  }
+  // First occurrence of the weekday in the year, by arithmetic rather
+  // than walking a day at a time
+  const jsWeekday = convertWeekday(rule.weekday);
+  const jan1Weekday = new Date(year, 0, 1).getDay();
+  const current = new Date(year, 0, 1 + ((jsWeekday - jan1Weekday + 7) % 7));
 
   // Add every week
   while (current <= end) {
@@ -166,39 +182,22 @@ function nthWeekdayOfMonth(
   nth: number
 ): Date | null {
   const jsWeekday = convertWeekday(weekday);
-  
+  const daysInMonth = new Date(year, month, 0).getDate();
+
   if (nth > 0) {
-    // Forward search (1st, 2nd, 3rd, etc.)
-    const firstDay = new Date(year, month - 1, 1);
-    const current = new Date(firstDay);
-    
-    // Find first occurrence
-    while (current.getDay() !== jsWeekday) {
-      current.setDate(current.getDate() + 1);
-    }
-    
-    // Add weeks for nth
-    current.setDate(current.getDate() + (nth - 1) * 7);
-    
-    // Check if still in same month
-    if (current.getMonth() === month - 1) {
-      return current;
+    // Forward: offset from the 1st to the first occurrence, then add weeks
+    const firstWeekday = new Date(year, month - 1, 1).getDay();
+    const day = 1 + ((jsWeekday - firstWeekday + 7) % 7) + (nth - 1) * 7;
+    if (day <= daysInMonth) {
+      return new Date(year, month - 1, day);
     }
   } else if (nth < 0) {
-    // Backward search (last, second-to-last, etc.)
-    const lastDay = new Date(year, month, 0); // Last day of month
-    const current = new Date(lastDay);
-    
-    // Find last occurrence
-    while (current.getDay() !== jsWeekday) {
-      current.setDate(current.getDate() - 1);
-    }
-    
-    // Subtract weeks for nth (-1 is last, -2 is second-to-last, etc.)
-    current.setDate(current.getDate() + (nth + 1) * 7);
-    
-    if (current.getMonth() === month - 1) {
-      return current;
+    // Backward: offset from the last day to the last occurrence,
+    // then subtract weeks (-1 is last, -2 is second-to-last, etc.)
+    const lastWeekday = new Date(year, month - 1, daysInMonth).getDay();
+    const day = daysInMonth - ((lastWeekday - jsWeekday + 7) % 7) + (nth + 1) * 7;
+    if (day >= 1) {
+      return new Date(year, month - 1, day);
     }
   }
 
@@ -266,28 +266,23 @@ export function parseScheduleFile(jsonString: string): { file: ScheduleFile | nu
  * Load a schedule file from a File object (browser File API)
  */
 export async function loadScheduleFile(file: File): Promise<{ scheduleFile: ScheduleFile | null; validation: ValidationResult }> {
-  return new Promise((resolve) => {
-    const reader = new FileReader();
-    
-    reader.onload = (e) => {
-      const content = e.target?.result as string;
-      const result = parseScheduleFile(content);
-      resolve({ scheduleFile: result.file, validation: result.validation });
-    };
-    
-    reader.onerror = () => {
-      resolve({
-        scheduleFile: null,
-        validation: {
-          valid: false,
-          errors: [{ path: '', message: 'Failed to read file' }],
-          warnings: [],
-        },
-      });
+  let content: string;
+
+  try {
+    content = await file.text();
+  } catch {
+    return {
+      scheduleFile: null,
+      validation: {
+        valid: false,
+        errors: [{ path: '', message: 'Failed to read file' }],
+        warnings: [],
+      },
     };
-    
-    reader.readAsText(file);
-  });
+  }
+
+  const result = parseScheduleFile(content);
+  return { scheduleFile: result.file, validation: result.validation };
 }
 
 // ============================================================================
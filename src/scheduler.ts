@@ -6,7 +6,7 @@
 import { Leader, Group, Event, Assignment, Schedule } from './models';
 import { RecurringRule, generateDates } from './rules';
 import { getStrategy, StrategyName } from './strategies';
-import { SeededRandom } from './utils';
+import { seededShuffle } from './utils';
 
 /**
  * Build Leader objects from raw config
@@ -62,27 +62,35 @@ export function expandEvents(
     const responsibility = rule.responsibility || { mode: 'none' as const };
     const mode = responsibility.mode || 'none';
     const rotationPool = responsibility.rotationPool || [];
+    // These depend only on the rule, so compute them once rather than
+    // per generated date
+    const leaderRequired = mode === 'leader' || rule.kind === 'separate';
+    const youthCount = rule.youthAssignments?.count || 0;
 
     dates.forEach(date => {
-      const leaderRequired = mode === 'leader' || rule.kind === 'separate';
+      // responsibleGroup is initialized up front (rather than added later
+      // by assignResponsibleGroups) so every Event keeps one object shape
       events.push({
         date,
         kind: rule.kind,
         description: rule.description,
         groupsInvolved: involved,
         responsibilityMode: mode,
+        responsibleGroup: undefined,
         leaderRequired,
         rotationPool,
         startTime: rule.startTime,
         durationMinutes: rule.durationMinutes,
-        youthCount: rule.youthAssignments?.count || 0,
+        youthCount,
       });
     });
   });
 
-  // Sort by date
-  events.sort((a, b) => a.date.getTime() - b.date.getTime());
-  return events;
+  // Sort by date, reading each timestamp once instead of per comparison
+  return events
+    .map(e => ({ ts: e.date.getTime(), event: e }))
+    .sort((a, b) => a.ts - b.ts)
+    .map(d => d.event);
 }
 
 /**
@@ -115,45 +123,30 @@ function assignResponsibleGroups(events: Event[], initialGroupState?: Map<string
     const pool = event.rotationPool!;
     const poolKey = pool.join(',');
     
-    // Create a deterministic seed from the event date plus seed offset
-    const seed = event.date.getTime() + randomSeed;
-    const rng = new SeededRandom(seed);
+    // Deterministically shuffle the pool, seeded from the event date
+    // plus seed offset, for the initial randomized starting order
+    const shuffledPool = seededShuffle(pool, event.date.getTime() + randomSeed);
     
-    // Deterministically shuffle the pool based on the seed
-    // This provides the initial randomized starting order
-    const shuffledPool = [...pool];
-    for (let i = shuffledPool.length - 1; i > 0; i--) {
-      const j = Math.floor(rng.next() * (i + 1));
-      [shuffledPool[i], shuffledPool[j]] = [shuffledPool[j], shuffledPool[i]];
-    }
-    
-    // Build candidate scores for each group in the shuffled pool
-    const candidates: Array<{ group: string; score: number; shuffledIndex: number }> = shuffledPool.map((group, shuffledIndex) => {
+    // Score each group in the shuffled pool and keep the best in one
+    // pass - only the winner is needed, so there is nothing to sort.
+    // Lower score is better: heavily weight recency (want groups that
+    // haven't been assigned recently) and total assignments (want fair
+    // distribution). Strict < keeps ties on the earliest shuffled
+    // position, matching the old sort's tiebreaker.
+    let selectedGroup = shuffledPool[0];
+    let bestScore = Infinity;
+    shuffledPool.forEach(group => {
       const assignmentCount = groupAssignmentCount.get(group) || 0;
       const lastAssignedIndex = groupLastAssigned.get(group) ?? -1;
       const eventsSinceLastAssignment = lastAssignedIndex === -1 ? 1000 : (eventIndex - lastAssignedIndex);
-      
-      // Lower score is better
-      // Heavily weight recency (want groups that haven't been assigned recently)
-      // Also weight total assignments (want fair distribution)
+
       const score = (assignmentCount * 100) - (eventsSinceLastAssignment * 10);
-      
-      return { group, score, shuffledIndex };
-    });
-    
-    // Sort by score (ascending - lowest score = best candidate)
-    // Then by shuffled pool order as tiebreaker for determinism
-    candidates.sort((a, b) => {
-      if (a.score !== b.score) {
-        return a.score - b.score;
+      if (score < bestScore) {
+        bestScore = score;
+        selectedGroup = group;
       }
-      // Tiebreaker: maintain shuffled pool order for determinism
-      return a.shuffledIndex - b.shuffledIndex;
     });
     
-    // Select the best candidate (lowest score)
-    const selectedGroup = candidates[0].group;
-    
     // Assign the group to the event
     event.responsibleGroup = selectedGroup;
     
@@ -177,7 +170,7 @@ function assignResponsibleGroups(events: Event[], initialGroupState?: Map<string
 function assignYouthToLeaders(
   event: Event,
   assignedLeaderNames: string[],
-  allLeaders: Leader[],
+  leadersByName: Map<string, Leader>,
   groups: Map<string, Group>,
   youthState: Map<string, number>,
   randomSeed: number = 0,
@@ -189,12 +182,9 @@ function assignYouthToLeaders(
     return result;
   }
   
-  // Get all leader names (to exclude them from youth selection)
-  const leaderNamesSet = new Set(allLeaders.map(l => l.name));
-  
   assignedLeaderNames.forEach(leaderName => {
     // Find the leader object to get their groups
-    const leader = allLeaders.find(l => l.name === leaderName);
+    const leader = leadersByName.get(leaderName);
     if (!leader) {
       result.push({ leader: leaderName, youth: [] });
       return;
@@ -210,14 +200,17 @@ function assignYouthToLeaders(
       eligibleGroups = leader.groups;
     }
     
-    // Collect all eligible youth from these groups
+    // Collect all eligible youth from these groups. A parallel Set gives
+    // O(1) dedup across groups while the array preserves member order.
     const eligibleYouth: string[] = [];
+    const seenYouth = new Set<string>();
     eligibleGroups.forEach(groupName => {
       const group = groups.get(groupName);
       if (group) {
         group.members.forEach(member => {
           // Don't assign leaders as youth
-          if (!leaderNamesSet.has(member) && !eligibleYouth.includes(member)) {
+          if (!leadersByName.has(member) && !seenYouth.has(member)) {
+            seenYouth.add(member);
             eligibleYouth.push(member);
           }
         });
@@ -229,17 +222,10 @@ function assignYouthToLeaders(
       return;
     }
     
-    // Create a deterministic seed from the event date, leader name, and seed offset
-    // This ensures different youth selections when random seed changes
+    // Seed from the event date, leader name, and seed offset so youth
+    // selections differ per leader and change with the random seed
     const seed = event.date.getTime() + leaderName.split('').reduce((acc, char) => acc + char.charCodeAt(0), 0) + randomSeed;
-    const rng = new SeededRandom(seed);
-    
-    // Deterministically shuffle the eligible youth based on the seed
-    const shuffled = [...eligibleYouth];
-    for (let i = shuffled.length - 1; i > 0; i--) {
-      const j = Math.floor(rng.next() * (i + 1));
-      [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
-    }
+    const shuffled = seededShuffle(eligibleYouth, seed);
     
     // Sort by assignment count (ascending) to maintain fairness
     // Youth with fewer assignments are selected first
@@ -290,6 +276,9 @@ export function buildSchedule(
   const leaders = buildLeaders(rawLeaders);
   const groups = buildGroups(rawGroups);
   const allGroupNames = Array.from(groups.keys());
+  // Name lookup built once; youth assignment resolves leaders by name
+  // per event and also uses this to keep leaders out of the youth pool
+  const leadersByName = new Map(leaders.map(l => [l.name, l]));
 
   // Generate events
   const events = expandEvents(rules, allGroupNames, start, end);
@@ -322,7 +311,7 @@ export function buildSchedule(
         youthAssignments = assignYouthToLeaders(
           event,
           leadersToAssign,
-          leaders,
+          leadersByName,
           groups,
           youthState,
           randomSeed
@@ -339,6 +328,7 @@ export function buildSchedule(
         startTime: event.startTime,
         durationMinutes: event.durationMinutes,
         youthAssignments,
+        groupAssignments: undefined,
       });
     } else {
       // Separate events: create ONE assignment with multiple group assignments
@@ -375,7 +365,7 @@ export function buildSchedule(
           youthAssignments = assignYouthToLeaders(
             event,
             leadersToAssign,
-            leaders,
+            leadersByName,
             groups,
             youthState,
             randomSeed,
@@ -400,6 +390,7 @@ export function buildSchedule(
         responsibleGroup: event.responsibleGroup,
         startTime: event.startTime,
         durationMinutes: event.durationMinutes,
+        youthAssignments: undefined,
         groupAssignments,
       });
     }
@@ -4,7 +4,7 @@
  */
 
 import { Leader, Event, isLeaderAvailable } from './models';
-import { SeededRandom } from './utils';
+import { SeededRandom, seededShuffle } from './utils';
 
 export type StrategyName = 'round-robin' | 'random' | 'weighted';
 
@@ -18,6 +18,126 @@ export interface AssignmentStrategy {
   ): string[];
 }
 
+// Per-leaders-array eligibility index, built once (the scheduler passes
+// the same array for every event). Group membership is encoded two ways:
+// an inverted map from group name to leader positions, and - when the
+// config has at most 31 distinct groups, which is always in practice -
+// one bit per group, so the per-event group test collapses to a single
+// integer AND per leader. Positions rather than leader objects so union
+// results can be sorted back into leaders-array order, which the shuffle
+// seed depends on.
+interface GroupIndex {
+  byGroup: Map<string, number[]>;
+  groupBits: Map<string, number> | null; // null when too many groups for bits
+  leaderMasks: number[];
+  alwaysAvailable: boolean[]; // empty availability = always available
+}
+
+const groupIndexCache = new WeakMap<Leader[], GroupIndex>();
+
+function getGroupIndex(leaders: Leader[]): GroupIndex {
+  let index = groupIndexCache.get(leaders);
+  if (!index) {
+    const byGroup = new Map<string, number[]>();
+    leaders.forEach((leader, i) => {
+      for (const group of leader.groups) {
+        const positions = byGroup.get(group);
+        if (positions) {
+          positions.push(i);
+        } else {
+          byGroup.set(group, [i]);
+        }
+      }
+    });
+
+    let groupBits: Map<string, number> | null = null;
+    let leaderMasks: number[] = [];
+    if (byGroup.size <= 31) {
+      groupBits = new Map();
+      let bit = 1;
+      for (const group of byGroup.keys()) {
+        groupBits.set(group, bit);
+        bit <<= 1;
+      }
+      leaderMasks = leaders.map(l =>
+        l.groups.reduce((mask, g) => mask | (groupBits!.get(g) || 0), 0)
+      );
+    }
+
+    // An empty availability list means always available; checking the
+    // flag first skips the date-feature lookup for the common case
+    const alwaysAvailable = leaders.map(l => l.availability.length === 0);
+
+    index = { byGroup, groupBits, leaderMasks, alwaysAvailable };
+    groupIndexCache.set(leaders, index);
+  }
+  return index;
+}
+
+// Several rules can land events on the same date with the same groups
+// (and the scheduler reuses one leaders array throughout a build), so the
+// filtered result is memoized per (leaders array, date, groups) rather
+// than recomputed per event. Strategies copy before shuffling, so the
+// cached arrays are never mutated.
+const eligibilityCache = new WeakMap<Leader[], Map<string, Leader[]>>();
+
+/**
+ * Leaders serving any of the event's groups and available on its date,
+ * in leaders-array order (same result as filtering the full array).
+ * Callers pass the event's timestamp so it is read once per assignment.
+ */
+function eligibleLeaders(event: Event, leaders: Leader[], dateTime: number): Leader[] {
+  let byKey = eligibilityCache.get(leaders);
+  if (!byKey) {
+    byKey = new Map();
+    eligibilityCache.set(leaders, byKey);
+  }
+
+  const key = `${dateTime}|${event.groupsInvolved.join(',')}`;
+  const cached = byKey.get(key);
+  if (cached) {
+    return cached;
+  }
+
+  const index = getGroupIndex(leaders);
+  let eligible: Leader[];
+
+  if (index.groupBits) {
+    // Bitmask path: one integer AND per leader answers "serves any of
+    // the event's groups", scanning in array order
+    let eventMask = 0;
+    for (const group of event.groupsInvolved) {
+      eventMask |= index.groupBits.get(group) || 0;
+    }
+    eligible = [];
+    for (let i = 0; i < leaders.length; i++) {
+      if (
+        (index.leaderMasks[i] & eventMask) !== 0 &&
+        (index.alwaysAvailable[i] || isLeaderAvailable(leaders[i], event.date))
+      ) {
+        eligible.push(leaders[i]);
+      }
+    }
+  } else {
+    const positions = new Set<number>();
+    for (const group of event.groupsInvolved) {
+      const forGroup = index.byGroup.get(group);
+      if (forGroup) {
+        for (const i of forGroup) {
+          positions.add(i);
+        }
+      }
+    }
+    eligible = [...positions]
+      .sort((a, b) => a - b)
+      .filter(i => index.alwaysAvailable[i] || isLeaderAvailable(leaders[i], event.date))
+      .map(i => leaders[i]);
+  }
+
+  byKey.set(key, eligible);
+  return eligible;
+}
+
 /**
  * Round-robin strategy: cycle through leaders fairly
  */
@@ -29,35 +149,37 @@ export class RoundRobinStrategy implements AssignmentStrategy {
     state: Map<string, number>,
     seedOffset: number = 0
   ): string[] {
-    const eligible = leaders.filter(
-      l =>
-        l.groups.some(g => event.groupsInvolved.includes(g)) &&
-        isLeaderAvailable(l, event.date)
-    );
+    const dateTime = event.date.getTime();
+    const eligible = eligibleLeaders(event, leaders, dateTime);
 
     if (eligible.length === 0) return [];
 
-    // Create a deterministic seed from the event date plus seed offset
-    const seed = event.date.getTime() + seedOffset;
-    const rng = new SeededRandom(seed);
-
-    // Deterministically shuffle the eligible leaders based on the seed
-    // This provides the initial randomized starting order
-    const shuffled = [...eligible];
-    for (let i = shuffled.length - 1; i > 0; i--) {
-      const j = Math.floor(rng.next() * (i + 1));
-      [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
-    }
+    // Deterministically shuffle the eligible leaders, seeded from the
+    // event date plus seed offset, for the initial randomized order
+    const shuffled = seededShuffle(eligible, dateTime + seedOffset);
 
-    // Sort by assignment count (ascending) to maintain round-robin fairness
-    // Leaders with fewer assignments are selected first
-    shuffled.sort((a, b) => {
-      const countA = state.get(a.name) || 0;
-      const countB = state.get(b.name) || 0;
-      return countA - countB;
-    });
+    // Leaders with fewer assignments are selected first, ties staying in
+    // shuffled order. Counts are read once per leader here rather than
+    // per comparison inside the sort.
+    const decorated = shuffled.map(l => ({ leader: l, count: state.get(l.name) || 0 }));
 
-    const selected = shuffled.slice(0, Math.min(count, shuffled.length));
+    let selected: Leader[];
+    if (count === 1) {
+      // The common case needs no sort: a single pass finds the first
+      // leader (in shuffled order) with the minimum count
+      let best = decorated[0];
+      for (let i = 1; i < decorated.length; i++) {
+        if (decorated[i].count < best.count) {
+          best = decorated[i];
+        }
+      }
+      selected = [best.leader];
+    } else {
+      decorated.sort((a, b) => a.count - b.count);
+      selected = decorated
+        .slice(0, Math.min(count, decorated.length))
+        .map(d => d.leader);
+    }
     
     // Update state
     selected.forEach(l => {
@@ -80,24 +202,13 @@ export class RandomStrategy implements AssignmentStrategy {
     state: Map<string, number>,
     seedOffset: number = 0
   ): string[] {
-    const eligible = leaders.filter(
-      l =>
-        l.groups.some(g => event.groupsInvolved.includes(g)) &&
-        isLeaderAvailable(l, event.date)
-    );
+    const dateTime = event.date.getTime();
+    const eligible = eligibleLeaders(event, leaders, dateTime);
 
     if (eligible.length === 0) return [];
 
-    // Create a deterministic seed from the event date plus optional seed offset
-    const seed = event.date.getTime() + seedOffset;
-    const rng = new SeededRandom(seed);
-
-    // Deterministic shuffle using seeded random
-    const shuffled = [...eligible];
-    for (let i = shuffled.length - 1; i > 0; i--) {
-      const j = Math.floor(rng.next() * (i + 1));
-      [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
-    }
+    // Deterministic shuffle seeded from the event date plus seed offset
+    const shuffled = seededShuffle(eligible, dateTime + seedOffset);
 
     const selected = shuffled.slice(0, Math.min(count, eligible.length));
 
@@ -111,7 +222,8 @@ export class RandomStrategy implements AssignmentStrategy {
 }
 
 /**
- * Weighted strategy: prefer leaders with higher weight values
+ * Weighted strategy: random selection biased toward higher weight values
+ * Deterministic using a seeded random number generator based on event date
  */
 export class WeightedStrategy implements AssignmentStrategy {
   assignLeaders(
@@ -119,27 +231,32 @@ export class WeightedStrategy implements AssignmentStrategy {
     leaders: Leader[],
     count: number,
     state: Map<string, number>,
-    _seedOffset?: number
+    seedOffset: number = 0
   ): string[] {
-    const eligible = leaders.filter(
-      l =>
-        l.groups.some(g => event.groupsInvolved.includes(g)) &&
-        isLeaderAvailable(l, event.date)
-    );
+    const dateTime = event.date.getTime();
+    const eligible = eligibleLeaders(event, leaders, dateTime);
 
     if (eligible.length === 0) return [];
 
-    // Sort by weight (descending), then by assignment count (ascending)
-    eligible.sort((a, b) => {
-      if (a.weight !== b.weight) {
-        return b.weight - a.weight; // Higher weight first
-      }
-      const countA = state.get(a.name) || 0;
-      const countB = state.get(b.name) || 0;
-      return countA - countB; // Fewer assignments first
-    });
+    // Create a deterministic seed from the event date plus seed offset
+    const rng = new SeededRandom(dateTime + seedOffset);
 
-    const selected = eligible.slice(0, Math.min(count, eligible.length));
+    // Cumulative-weight sampling without replacement: each draw picks a
+    // point on the remaining leaders' cumulative weight line, so higher
+    // weights win proportionally more often without expanding leaders
+    // weight-times into a temporary list
+    const remaining = [...eligible];
+    const selected: Leader[] = [];
+    const target = Math.min(count, eligible.length);
+
+    while (selected.length < target) {
+      let total = 0;
+      const cumulative = remaining.map(l => (total += Math.max(1, l.weight)));
+      const r = rng.next() * total;
+      let i = 0;
+      while (cumulative[i] <= r) i++;
+      selected.push(remaining.splice(i, 1)[0]);
+    }
 
     // Update state
     selected.forEach(l => {
@@ -150,18 +267,24 @@ export class WeightedStrategy implements AssignmentStrategy {
   }
 }
 
+// Strategies hold no per-schedule state (everything is threaded through
+// the state map), so one shared instance of each is enough
+const roundRobinStrategy = new RoundRobinStrategy();
+const randomStrategy = new RandomStrategy();
+const weightedStrategy = new WeightedStrategy();
+
 /**
  * Get strategy by name
  */
 export function getStrategy(name: StrategyName): AssignmentStrategy {
   switch (name) {
     case 'round-robin':
-      return new RoundRobinStrategy();
+      return roundRobinStrategy;
     case 'random':
-      return new RandomStrategy();
+      return randomStrategy;
     case 'weighted':
-      return new WeightedStrategy();
+      return weightedStrategy;
     default:
-      return new RoundRobinStrategy();
+      return roundRobinStrategy;
   }
 }
@@ -14,3 +14,17 @@ export class SeededRandom {
     return this.seed / 233280;
   }
 }
+
+/**
+ * Return a seeded Fisher-Yates shuffle of the array (the input is not
+ * modified). The same seed always produces the same order.
+ */
+export function seededShuffle<T>(items: readonly T[], seed: number): T[] {
+  const rng = new SeededRandom(seed);
+  const shuffled = [...items];
+  for (let i = shuffled.length - 1; i > 0; i--) {
+    const j = Math.floor(rng.next() * (i + 1));
+    [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
+  }
+  return shuffled;
+}
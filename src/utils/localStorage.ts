@@ -19,6 +19,12 @@ export interface RecentFile {
   hasContent: boolean; // Whether we have the file content stored
 }
 
+// Parsed-result caches keyed on the raw localStorage string, so repeated
+// reads (every WelcomeView render, every addRecentFile call) skip
+// re-parsing JSON that hasn't changed since the last read or write.
+let recentFilesCache: { raw: string; files: RecentFile[] } | null = null;
+let autoSaveCache: { raw: string; file: ScheduleFile } | null = null;
+
 /**
  * Get list of recently opened files
  */
@@ -26,7 +32,12 @@ export function getRecentFiles(): RecentFile[] {
   try {
     const stored = localStorage.getItem(STORAGE_KEYS.RECENT_FILES);
     if (!stored) return [];
-    return JSON.parse(stored);
+    if (recentFilesCache && recentFilesCache.raw === stored) {
+      return recentFilesCache.files;
+    }
+    const files = JSON.parse(stored) as RecentFile[];
+    recentFilesCache = { raw: stored, files };
+    return files;
   } catch {
     return [];
   }
@@ -126,8 +137,11 @@ export function clearRecentFiles(): void {
 export function saveSession(file: ScheduleFile): void {
   try {
     console.log('[localStorage] Saving session:', file.name);
-    localStorage.setItem(STORAGE_KEYS.AUTO_SAVE, JSON.stringify(file));
+    const raw = JSON.stringify(file);
+    localStorage.setItem(STORAGE_KEYS.AUTO_SAVE, raw);
     localStorage.setItem(STORAGE_KEYS.AUTO_SAVE_TIMESTAMP, new Date().toISOString());
+    // Seed the cache so the next getAutoSavedSession doesn't re-parse
+    autoSaveCache = { raw, file };
     console.log('[localStorage] Session saved successfully');
   } catch (e) {
     console.warn('Failed to auto-save session:', e);
@@ -146,8 +160,14 @@ export function getAutoSavedSession(): { file: ScheduleFile; timestamp: string }
     console.log('[localStorage] fileData exists:', !!fileData, 'timestamp:', timestamp);
     
     if (!fileData || !timestamp) return null;
-    
-    const file = JSON.parse(fileData) as ScheduleFile;
+
+    let file: ScheduleFile;
+    if (autoSaveCache && autoSaveCache.raw === fileData) {
+      file = autoSaveCache.file;
+    } else {
+      file = JSON.parse(fileData) as ScheduleFile;
+      autoSaveCache = { raw: fileData, file };
+    }
     console.log('[localStorage] Found auto-saved session:', file.name);
     return { file, timestamp };
   } catch (e) {
@@ -161,6 +181,7 @@ export function getAutoSavedSession(): { file: ScheduleFile; timestamp: string }
  */
 export function clearAutoSavedSession(): void {
   try {
+    autoSaveCache = null;
     localStorage.removeItem(STORAGE_KEYS.AUTO_SAVE);
     localStorage.removeItem(STORAGE_KEYS.AUTO_SAVE_TIMESTAMP);
   } catch (e) {